@@ -4,6 +4,7 @@ from typing import List
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
+from app.core.cache import get_cached_election_list, cache_election_list
 from app.core.database import get_db
 from app.core.dependencies import require_role, get_current_user
 from app.models.user import User
@@ -19,24 +20,28 @@ from app.schemas.election_schema import (
     VoterResponse,
 )
 from app.services.election_service import ElectionService
-from app.repositories.vote_repository import VoteRepository
 from app.repositories.user_repository import UserRepository
 
 router = APIRouter(prefix="/api/elections", tags=["Elections"])
 
 
-def _election_to_response(e, candidates, db):
-    """Build ElectionResponse with total_votes."""
-    total_votes = VoteRepository.get_total_votes(db, e.id)
-    return ElectionResponse(
+def _election_to_response(e, candidate_descriptions: bool = True):
+    """Build ElectionResponse with candidates and total_votes.
+
+    Uses model_construct to skip validation: only call this with ORM rows, whose
+    column types already match the schema. List views load candidates without
+    descriptions, so pass candidate_descriptions=False for them.
+    """
+    return ElectionResponse.model_construct(
         id=e.id, organization_id=e.organization_id, title=e.title,
         description=e.description, start_time=e.start_time, end_time=e.end_time,
         status=e.status, created_by=e.created_by, created_at=e.created_at,
-        candidates=[CandidateResponse(
+        candidates=[CandidateResponse.model_construct(
             id=c.id, election_id=c.election_id, name=c.name,
-            description=c.description, created_at=c.created_at
-        ) for c in candidates],
-        total_votes=total_votes,
+            description=c.description if candidate_descriptions else None,
+            created_at=c.created_at
+        ) for c in e.candidates],
+        total_votes=e.total_votes,
     )
 
 
@@ -57,8 +62,7 @@ def create_election(
         end_time=data.end_time,
         created_by=current_user.id,
     )
-    candidates = ElectionService.get_candidates(db, election.id)
-    return _election_to_response(election, candidates, db)
+    return _election_to_response(ElectionService.get_election(db, election.id))
 
 
 @router.get("/", response_model=List[ElectionResponse])
@@ -69,11 +73,12 @@ def list_elections(
     db: Session = Depends(get_db),
 ):
     """List all elections."""
+    cached = get_cached_election_list(skip, limit)
+    if cached is not None:
+        return cached
     elections = ElectionService.get_all_elections(db, skip=skip, limit=limit)
-    result = []
-    for e in elections:
-        candidates = ElectionService.get_candidates(db, e.id)
-        result.append(_election_to_response(e, candidates, db))
+    result = [_election_to_response(e, candidate_descriptions=False) for e in elections]
+    cache_election_list(skip, limit, result)
     return result
 
 
@@ -85,8 +90,7 @@ def get_election(
 ):
     """Get election by ID."""
     e = ElectionService.get_election(db, election_id)
-    candidates = ElectionService.get_candidates(db, e.id)
-    return _election_to_response(e, candidates, db)
+    return _election_to_response(e)
 
 
 @router.put("/{election_id}", response_model=ElectionResponse)
@@ -98,9 +102,8 @@ def update_election(
 ):
     """Update an election (draft only)."""
     update_data = data.model_dump(exclude_unset=True)
-    e = ElectionService.update_election(db, election_id, **update_data)
-    candidates = ElectionService.get_candidates(db, e.id)
-    return _election_to_response(e, candidates, db)
+    ElectionService.update_election(db, election_id, **update_data)
+    return _election_to_response(ElectionService.get_election(db, election_id))
 
 
 @router.put("/{election_id}/activate")
@@ -4,6 +4,7 @@ from typing import List
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
+from app.core.cache import invalidate_user
 from app.core.database import get_db
 from app.core.dependencies import require_role
 from app.models.user import User
@@ -21,22 +22,19 @@ def list_users(
     db: Session = Depends(get_db),
 ):
     """List all users (admin only)."""
-    users = UserRepository.get_all(db, skip=skip, limit=limit)
-    result = []
-    for user in users:
-        roles = UserRepository.get_user_roles(db, user.id)
-        result.append(
-            UserResponse(
-                id=user.id,
-                email=user.email,
-                emp_id=user.emp_id,
-                full_name=user.full_name,
-                is_active=user.is_active,
-                created_at=user.created_at,
-                roles=roles,
-            )
+    users = UserRepository.get_all_with_roles(db, skip=skip, limit=limit)
+    return [
+        UserResponse(
+            id=user.id,
+            email=user.email,
+            emp_id=user.emp_id,
+            full_name=user.full_name,
+            is_active=user.is_active,
+            created_at=user.created_at,
+            roles=[r.name for r in user.roles],
         )
-    return result
+        for user in users
+    ]
 
 
 @router.put("/{user_id}/roles")
@@ -57,6 +55,8 @@ def assign_role(
         from fastapi import HTTPException, status
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Role not found")
 
+    db.commit()
+    invalidate_user(user_id)
     roles = UserRepository.get_user_roles(db, user_id)
     return {"message": f"Role {data.role_name} assigned", "roles": roles}
 
@@ -91,5 +91,7 @@ def remove_role(
 ):
     """Remove a role from a user (super admin only)."""
     UserRepository.remove_role(db, user_id, role_name)
+    db.commit()
+    invalidate_user(user_id)
     roles = UserRepository.get_user_roles(db, user_id)
     return {"message": f"Role {role_name} removed", "roles": roles}
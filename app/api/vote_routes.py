@@ -1,10 +1,12 @@
 """Vote API routes."""
 
-from fastapi import APIRouter, Depends
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, utc_now
 from app.models.user import User
 from app.schemas.vote_schema import VoteCast, VoteConfirmation, ElectionResults, VoteStatusResponse
 from app.services.vote_service import VoteService
@@ -17,6 +19,7 @@ def cast_vote(
     data: VoteCast,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    now: datetime = Depends(utc_now),
 ):
     """Cast a vote in an election. Enforces anonymity and prevents duplicates."""
     return VoteService.cast_vote(
@@ -24,6 +27,7 @@ def cast_vote(
         user_id=current_user.id,
         election_id=data.election_id,
         candidate_id=data.candidate_id,
+        now=now,
     )
 
 
@@ -40,8 +44,15 @@ def get_results(
 @router.get("/status/{election_id}", response_model=VoteStatusResponse)
 def check_vote_status(
     election_id: str,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Check if the current user has already voted in an election."""
-    return VoteService.check_vote_status(db, current_user.id, election_id)
+    vote_status = VoteService.check_vote_status(db, current_user.id, election_id)
+    if vote_status["has_voted"]:
+        # A cast vote is permanent, so let the browser stop polling. Vary keeps
+        # another login on the same browser from reading this user's answer.
+        response.headers["Cache-Control"] = "private, max-age=86400, immutable"
+        response.headers["Vary"] = "Authorization"
+    return vote_status
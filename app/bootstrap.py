@@ -0,0 +1,95 @@
+"""One-shot database bootstrap: apply Alembic migrations and seed base data.
+
+Run once per deployment, before starting workers::
+
+    python -m app.bootstrap
+"""
+
+import os
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect, select, text
+
+from app.core.config import get_settings
+from app.core.database import engine, SessionLocal, IS_SQLITE, dialect_insert
+from app.core.security import hash_password
+from app.models.user import User
+from app.models.role import Role, UserRole
+from app.models import organization, election, vote  # noqa: F401 — register mappers for relationships
+
+settings = get_settings()
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(__file__)), "alembic.ini")
+
+# System roles
+SYSTEM_ROLES = ["SUPER_ADMIN", "ORG_ADMIN", "ELECTION_MANAGER", "VOTER"]
+
+
+def run_migrations():
+    """Upgrade the database to the latest Alembic revision."""
+    config = Config(ALEMBIC_INI)
+    config.attributes["configure_logger"] = False
+
+    # Databases created before Alembic was introduced (via create_all) have the
+    # tables but no version row; stamp them at the matching revision first.
+    insp = inspect(engine)
+    tables = insp.get_table_names()
+    if "users" in tables and "alembic_version" not in tables:
+        cols = [c["name"] for c in insp.get_columns("users")]
+        command.stamp(config, "0002" if "emp_id" in cols else "0001")
+        print("[OK] Stamped existing database for Alembic")
+
+    command.upgrade(config, "head")
+    print("[OK] Database migrated")
+
+
+def seed_database():
+    """Seed roles and super admin."""
+    db = SessionLocal()
+    try:
+        # Seed roles in one statement; existing roles are left untouched
+        db.execute(
+            dialect_insert(Role)
+            .values([{"name": role_name} for role_name in SYSTEM_ROLES])
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+        db.commit()
+
+        # Seed super admin
+        admin = db.scalars(select(User).where(User.email == settings.SUPER_ADMIN_EMAIL)).first()
+        if not admin:
+            admin = User(
+                email=settings.SUPER_ADMIN_EMAIL,
+                password_hash=hash_password(settings.SUPER_ADMIN_PASSWORD),
+                full_name="Super Admin",
+                is_active=True,
+            )
+            db.add(admin)
+            db.commit()
+
+            # Assign SUPER_ADMIN role
+            super_admin_role = db.scalars(select(Role).where(Role.name == "SUPER_ADMIN")).first()
+            if super_admin_role:
+                db.add(UserRole(user_id=admin.id, role_id=super_admin_role.id))
+                db.commit()
+
+            print(f"[OK] Super admin created: {settings.SUPER_ADMIN_EMAIL}")
+        else:
+            print(f"[INFO] Super admin already exists: {settings.SUPER_ADMIN_EMAIL}")
+    finally:
+        db.close()
+
+
+def bootstrap():
+    """Migrate the schema, then seed roles and the super admin."""
+    run_migrations()
+    seed_database()
+    if IS_SQLITE:
+        # SQLite has no autovacuum/autoanalyze; refresh planner stats for the new indexes
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+
+
+if __name__ == "__main__":
+    bootstrap()
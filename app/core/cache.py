@@ -0,0 +1,114 @@
+"""In-process caches shared across requests within a worker.
+
+Invalidation is local to the worker that performs the write; other workers
+catch up when their entries expire, so every mutable entry carries a TTL.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+
+from app.core.config import get_settings
+from app.models.user import User
+
+settings = get_settings()
+
+_lock = threading.Lock()
+
+# Minimal snapshots of active users, keyed by user id. Bounded by the access
+# token lifetime so a cached entry never outlives the token that produced it.
+_USER_FIELDS = ("id", "email", "emp_id", "full_name", "is_active", "created_at")
+_user_cache = TTLCache(maxsize=10_000, ttl=settings.USER_CACHE_TTL_SECONDS)
+
+# Verified access-token claims, keyed by the raw token string.
+_token_cache = TTLCache(maxsize=5_000, ttl=settings.TOKEN_CACHE_TTL_SECONDS)
+
+# Rendered election list pages, keyed by (skip, limit).
+_election_list_cache = TTLCache(maxsize=256, ttl=settings.ELECTION_LIST_CACHE_TTL_SECONDS)
+
+# Role name -> id. Roles are seeded once and never renamed or deleted, so the
+# map is loaded on first use and only grows (RoleRepository.get_or_create).
+_role_ids: Dict[str, int] = {}
+
+# Results of closed elections never change, but the election can be deleted;
+# the TTL bounds how long other workers keep serving them after that.
+_results_cache = TTLCache(maxsize=1024, ttl=settings.RESULTS_CACHE_TTL_SECONDS)
+
+
+def get_cached_user(user_id: str) -> Optional[User]:
+    """Return a detached User built from the cached snapshot, if present."""
+    with _lock:
+        snapshot = _user_cache.get(user_id)
+    if snapshot is None:
+        return None
+    return User(**snapshot)
+
+
+def cache_user(user: User) -> None:
+    """Store a minimal snapshot of an active user."""
+    snapshot = {field: getattr(user, field) for field in _USER_FIELDS}
+    with _lock:
+        _user_cache[user.id] = snapshot
+
+
+def invalidate_user(user_id: str) -> None:
+    """Drop a user's cached snapshot (call after role or status changes)."""
+    with _lock:
+        _user_cache.pop(user_id, None)
+
+
+def get_cached_token_payload(token: str) -> Optional[dict]:
+    """Return cached claims for a previously verified token that has not expired."""
+    with _lock:
+        payload = _token_cache.get(token)
+    if payload is None or payload["exp"] <= time.time():
+        return None
+    return payload
+
+
+def cache_token_payload(token: str, payload: dict) -> None:
+    with _lock:
+        _token_cache[token] = payload
+
+
+def get_cached_election_list(skip: int, limit: int) -> Optional[Any]:
+    with _lock:
+        return _election_list_cache.get((skip, limit))
+
+
+def cache_election_list(skip: int, limit: int, elections: Any) -> None:
+    with _lock:
+        _election_list_cache[(skip, limit)] = elections
+
+
+def invalidate_election_list() -> None:
+    """Drop all cached election list pages (call after any election change)."""
+    with _lock:
+        _election_list_cache.clear()
+
+
+def get_cached_role_ids() -> Dict[str, int]:
+    with _lock:
+        return dict(_role_ids)
+
+
+def cache_role_ids(role_ids: Dict[str, int]) -> None:
+    with _lock:
+        _role_ids.update(role_ids)
+
+
+def get_cached_results(election_id: str) -> Optional[Any]:
+    with _lock:
+        return _results_cache.get(election_id)
+
+
+def cache_results(election_id: str, results: Any) -> None:
+    with _lock:
+        _results_cache[election_id] = results
+
+
+def invalidate_results(election_id: str) -> None:
+    with _lock:
+        _results_cache.pop(election_id, None)
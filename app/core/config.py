@@ -1,5 +1,6 @@
 """Application configuration loaded from environment variables."""
 
+from typing import Optional
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -10,6 +11,22 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./voting_system.db"
 
+    # Connection pool (ignored for SQLite; use PostgreSQL in production)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+
+    # Server-side per-statement limit on PostgreSQL (0 disables)
+    DB_STATEMENT_TIMEOUT_MS: int = 5000
+
+    # SQLAlchemy compiled-statement cache entries, and optional hit counters
+    DB_QUERY_CACHE_SIZE: int = 1200
+    DB_STATEMENT_STATS: bool = False
+
+    # Worker threads for sync endpoints; defaults to the DB pool capacity
+    THREADPOOL_SIZE: Optional[int] = None
+
     # JWT
     JWT_SECRET_KEY: str = "change-this-super-secret-jwt-key-in-production"
     JWT_REFRESH_SECRET_KEY: str = "change-this-refresh-secret-key-in-production"
@@ -17,6 +34,19 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # Per-worker cache of authenticated users (must not exceed token lifetime)
+    USER_CACHE_TTL_SECONDS: int = 60
+
+    # Per-worker cache of verified access-token claims (expiry is still checked)
+    TOKEN_CACHE_TTL_SECONDS: int = 30
+
+    # Election list cache; vote totals in the list may lag by up to this long
+    ELECTION_LIST_CACHE_TTL_SECONDS: int = 10
+
+    # Closed-election results cache; other workers may serve results of a
+    # deleted election for up to this long
+    RESULTS_CACHE_TTL_SECONDS: int = 60
+
     # HMAC Secret for Vote Anonymity
     HMAC_SECRET_KEY: str = "change-this-hmac-secret-key-in-production"
 
@@ -24,6 +54,10 @@ class Settings(BaseSettings):
     APP_NAME: str = "Secure Voting Platform"
     DEBUG: bool = False
 
+    # Run Alembic migrations and seeding inside the app lifespan (dev only;
+    # multi-worker deployments should run `python -m app.bootstrap` instead)
+    RUN_MIGRATIONS_ON_STARTUP: bool = False
+
     # Super Admin Seed
     SUPER_ADMIN_EMAIL: str = "admin@votingplatform.com"
     SUPER_ADMIN_PASSWORD: str = "Admin@123456"
@@ -1,19 +1,55 @@
 """Database engine, session, and base model configuration."""
 
-from sqlalchemy import create_engine, event
+import uuid
+from collections import Counter
+
+from sqlalchemy import DateTime, String, TypeDecorator, create_engine, event, make_url
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.sql.expression import FunctionElement
 from app.core.config import get_settings
 
 settings = get_settings()
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    echo=settings.DEBUG,
-)
+IS_SQLITE = settings.DATABASE_URL.startswith("sqlite")
+IS_POSTGRES = settings.DATABASE_URL.startswith("postgresql")
+
+database_url = make_url(settings.DATABASE_URL)
+if database_url.drivername == "postgresql":
+    # A bare postgresql:// picks the dialect's default driver, which is psycopg 3
+    # from SQLAlchemy 2.1 on; requirements.txt ships psycopg2
+    database_url = database_url.set(drivername="postgresql+psycopg2")
+
+if IS_SQLITE:
+    engine = create_engine(
+        database_url,
+        connect_args={"check_same_thread": False},
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        echo=settings.DEBUG,
+    )
+else:
+    connect_args = {}
+    if IS_POSTGRES and settings.DB_STATEMENT_TIMEOUT_MS:
+        # Fail runaway queries instead of letting them hold a pooled connection
+        connect_args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+    engine = create_engine(
+        database_url,
+        connect_args=connect_args,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        # Reuse the most recently returned connection so idle extras age out
+        # via pool_recycle instead of every connection being kept lukewarm
+        pool_use_lifo=True,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        echo=settings.DEBUG,
+    )
 
 
-@event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
     """Enable foreign key enforcement and WAL mode for SQLite."""
     cursor = dbapi_connection.cursor()
@@ -22,14 +58,101 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor.close()
 
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+if IS_SQLITE:
+    event.listen(engine, "connect", set_sqlite_pragma)
+
+
+# Statement / compiled-cache counters, enabled with DB_STATEMENT_STATS=true
+statement_stats = Counter()
+
+
+def count_statement(conn, cursor, statement, parameters, context, executemany):
+    """Count executed statements and how many reused a cached compiled form."""
+    statement_stats["statements"] += 1
+    if context is not None and context.cache_hit == context.dialect.CACHE_HIT:
+        statement_stats["cache_hits"] += 1
+
+
+if settings.DB_STATEMENT_STATS:
+    event.listen(engine, "before_cursor_execute", count_statement)
+
+
+def dialect_insert(model):
+    """Return an INSERT for the engine's dialect that supports ON CONFLICT clauses."""
+    if engine.dialect.name == "postgresql":
+        return pg_insert(model)
+    if engine.dialect.name == "sqlite":
+        return sqlite_insert(model)
+    raise NotImplementedError(f"ON CONFLICT inserts are not supported on {engine.dialect.name}")
+
+
+class GUID(TypeDecorator):
+    """UUID key column: native 16-byte ``uuid`` on PostgreSQL, ``VARCHAR(36)`` elsewhere.
+
+    Values stay plain strings in Python. On PostgreSQL a string that is not a
+    valid UUID binds as NULL, so looking up a malformed id finds nothing
+    instead of raising a cast error.
+    """
+
+    impl = String(36)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(PG_UUID(as_uuid=False))
+        return dialect.type_descriptor(String(36))
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name != "postgresql":
+            return value
+        try:
+            return str(uuid.UUID(str(value)))
+        except ValueError:
+            return None
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else str(value)
+
+
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, evaluated by the database.
+
+    Used as ``server_default`` so inserts need no Python-side datetime.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    # now() is timestamptz; convert explicitly so the session time zone is irrelevant
+    return "(now() AT TIME ZONE 'utc')"
+
+
+# expire_on_commit=False: sessions live for one request, and objects written in
+# it already hold their values, so re-SELECTing them after commit is wasted I/O.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
 
 
 def get_db():
-    """FastAPI dependency that provides a database session."""
+    """FastAPI dependency that provides a database session.
+
+    Repositories only flush; the service or route that owns a write commits it
+    once, before the response is built. Anything left uncommitted when the
+    request fails is rolled back.
+    """
     db = SessionLocal()
     try:
         yield db
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
@@ -1,23 +1,44 @@
 """FastAPI dependencies for authentication and RBAC."""
 
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import FrozenSet
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 
+from app.core.cache import get_cached_user, cache_user, get_cached_token_payload, cache_token_payload
 from app.core.database import get_db
 from app.core.security import decode_access_token
 from app.models.user import User
-from app.models.role import UserRole, Role
 
 security_scheme = HTTPBearer()
 
 
-def get_current_user(
+def utc_now() -> datetime:
+    """Timezone-aware UTC timestamp, taken once per request.
+
+    FastAPI caches dependency results per request, so every consumer of the
+    request (route, service, nested dependencies) sees the same instant.
+    """
+    return datetime.now(timezone.utc)
+
+
+def get_token_payload(
     credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
-    db: Session = Depends(get_db),
-) -> User:
-    """Extract and validate the current user from the JWT access token."""
+) -> dict:
+    """Decode the bearer access token once per request and return its claims.
+
+    Verified claims are cached per worker, so a token polled repeatedly skips
+    signature verification until its cache entry or the token itself expires.
+    """
     token = credentials.credentials
+    payload = get_cached_token_payload(token)
+    if payload is not None:
+        return payload
+
     payload = decode_access_token(token)
     if payload is None:
         raise HTTPException(
@@ -25,45 +46,73 @@ def get_current_user(
             detail="Invalid or expired token",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    cache_token_payload(token, payload)
+    return payload
+
+
+@dataclass(frozen=True)
+class AuthContext:
+    """Authenticated user plus the role names granted by their access token."""
 
+    user: User
+    roles: FrozenSet[str]
+
+
+def get_auth_context(
+    payload: dict = Depends(get_token_payload),
+    db: Session = Depends(get_db),
+) -> AuthContext:
+    """Resolve the user and roles for the request in one dependency.
+
+    Roles come from the access token's ``roles`` claim (set at login and
+    refresh), so role changes take effect once the user obtains a new token.
+    """
     user_id = payload.get("sub")
     if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload",
         )
+    roles = frozenset(payload.get("roles") or ())
+
+    cached = get_cached_user(user_id)
+    if cached is not None:
+        # Attach the snapshot to this request's session without a SELECT, so
+        # later UserRepository.get_by_id calls in the request hit the identity map.
+        make_transient_to_detached(cached)
+        return AuthContext(user=db.merge(cached, load=False), roles=roles)
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if user is None or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive",
         )
 
-    return user
+    cache_user(user)
+    return AuthContext(user=user, roles=roles)
 
 
+def get_current_user(auth: AuthContext = Depends(get_auth_context)) -> User:
+    """Extract and validate the current user from the JWT access token."""
+    return auth.user
+
+
+@lru_cache(maxsize=None)
 def require_role(*allowed_roles: str):
-    """Dependency factory: returns current user if they have one of the allowed roles."""
-
-    def role_checker(
-        current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db),
-    ) -> User:
-        user_roles = (
-            db.query(Role.name)
-            .join(UserRole, UserRole.role_id == Role.id)
-            .filter(UserRole.user_id == current_user.id)
-            .all()
-        )
-        user_role_names = {r.name for r in user_roles}
+    """Dependency factory: returns current user if they have one of the allowed roles.
+
+    Memoized so every endpoint declaring the same roles shares one checker.
+    """
+    allowed = frozenset(allowed_roles)
 
-        if not user_role_names.intersection(set(allowed_roles)):
+    def role_checker(auth: AuthContext = Depends(get_auth_context)) -> User:
+        if auth.roles.isdisjoint(allowed):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Insufficient permissions. Required: {', '.join(allowed_roles)}",
             )
 
-        return current_user
+        return auth.user
 
     return role_checker
@@ -3,10 +3,11 @@
 import hashlib
 import hmac
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
 import bcrypt
-from jose import JWTError, jwt
+import jwt
 
 from app.core.config import get_settings
 
@@ -58,7 +59,7 @@ def decode_access_token(token: str) -> Optional[dict]:
         if payload.get("type") != "access":
             return None
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
 
@@ -71,11 +72,16 @@ def decode_refresh_token(token: str) -> Optional[dict]:
         if payload.get("type") != "refresh":
             return None
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
 
-# --- Vote Anonymity: HMAC + SHA256 ---
+# --- Vote Anonymity: HMAC-SHA256 ---
+# Keyed once; each token copies this context instead of re-deriving the key pads
+_vote_hmac = hmac.new(settings.HMAC_SECRET_KEY.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+@lru_cache(maxsize=10_000)
 def generate_vote_token(user_id: str, election_id: str) -> str:
     """Generate a deterministic HMAC token for a voter+election pair.
 
@@ -83,15 +89,22 @@ def generate_vote_token(user_id: str, election_id: str) -> str:
     In order to support our AI authentication logic we typically pass the
     employee ID (emp_id) if available, falling back to the UUID.  This prevents
     the same human from casting multiple votes using different accounts.
+
+    The HMAC-SHA256 hex digest is already a keyed one-way digest, so it is
+    stored as-is in ``votes.hashed_voter_token`` without a second SHA256 pass.
+
+    Tokens are deterministic, so results are memoized for repeated status polls.
     """
-    message = f"{user_id}:{election_id}".encode("utf-8")
-    return hmac.new(
-        settings.HMAC_SECRET_KEY.encode("utf-8"),
-        message,
-        hashlib.sha256,
-    ).hexdigest()
+    mac = _vote_hmac.copy()
+    mac.update(f"{user_id}:{election_id}".encode("utf-8"))
+    return mac.hexdigest()
+
 
+def legacy_vote_token(token: str) -> str:
+    """SHA256 of a vote token: the form votes stored before tokens were kept as-is.
 
-def hash_vote_token(token: str) -> str:
-    """SHA256 hash a vote token for storage."""
+    Cast and status checks match this too, so a voter whose vote predates the
+    change cannot vote again in an election still running. Remove once every
+    election holding legacy-format tokens has closed.
+    """
     return hashlib.sha256(token.encode("utf-8")).hexdigest()
@@ -2,19 +2,15 @@
 
 import os
 from contextlib import asynccontextmanager
+import anyio
 from fastapi.responses import RedirectResponse
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from app.bootstrap import bootstrap
 from app.core.config import get_settings
-from app.core.database import engine, Base, SessionLocal
-from app.core.security import hash_password
-from app.models.user import User
-from app.models.role import Role, UserRole
-from app.models.organization import Organization
-from app.models.election import Election, Candidate, Voter
-from app.models.vote import Vote
+from app.core.database import IS_SQLITE
 
 from app.api.auth_routes import router as auth_router
 from app.api.user_routes import router as user_router
@@ -24,72 +20,26 @@ from app.api.vote_routes import router as vote_router
 
 settings = get_settings()
 
-# System roles
-SYSTEM_ROLES = ["SUPER_ADMIN", "ORG_ADMIN", "ELECTION_MANAGER", "VOTER"]
-
-
-def seed_database():
-    """Seed roles and super admin on startup."""
-    db = SessionLocal()
-    try:
-        # Seed roles
-        for role_name in SYSTEM_ROLES:
-            existing = db.query(Role).filter(Role.name == role_name).first()
-            if not existing:
-                db.add(Role(name=role_name))
-        db.commit()
-
-        # Seed super admin
-        admin = db.query(User).filter(User.email == settings.SUPER_ADMIN_EMAIL).first()
-        if not admin:
-            admin = User(
-                email=settings.SUPER_ADMIN_EMAIL,
-                password_hash=hash_password(settings.SUPER_ADMIN_PASSWORD),
-                full_name="Super Admin",
-                is_active=True,
-            )
-            db.add(admin)
-            db.commit()
-            db.refresh(admin)
-
-            # Assign SUPER_ADMIN role
-            super_admin_role = db.query(Role).filter(Role.name == "SUPER_ADMIN").first()
-            if super_admin_role:
-                db.add(UserRole(user_id=admin.id, role_id=super_admin_role.id))
-                db.commit()
-
-            print(f"[OK] Super admin created: {settings.SUPER_ADMIN_EMAIL}")
-        else:
-            print(f"[INFO] Super admin already exists: {settings.SUPER_ADMIN_EMAIL}")
-    finally:
-        db.close()
-
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Application lifespan — create tables, perform soft migrations, and seed data on startup."""
-    # Create any missing tables (won't alter existing ones)
-    Base.metadata.create_all(bind=engine)
-    print("[OK] Database tables created")
-
-    # make sure `emp_id` column added to users table for dev environments
-    from sqlalchemy import inspect, text
-    insp = inspect(engine)
-    if 'users' in insp.get_table_names():
-        cols = [c['name'] for c in insp.get_columns('users')]
-        if 'emp_id' not in cols:
-            # sqlite alter table to add new column; other DBs may support similar syntax
-            with engine.connect() as conn:
-                try:
-                    conn.execute(text("ALTER TABLE users ADD COLUMN emp_id VARCHAR(50)"))
-                    # add unique index if supported
-                    conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_emp_id ON users(emp_id)"))
-                    print("[OK] Added emp_id column to users table")
-                except Exception as e:
-                    print(f"[WARN] failed to add emp_id column: {e}")
-
-    # Seed roles and super admin
-    seed_database()
+    """Application lifespan — optionally migrate/seed, then size the threadpool.
+
+    Schema changes are applied by ``python -m app.bootstrap`` (Alembic) as a
+    one-shot step before starting workers. Set RUN_MIGRATIONS_ON_STARTUP for
+    single-process development setups.
+    """
+    if settings.RUN_MIGRATIONS_ON_STARTUP:
+        await anyio.to_thread.run_sync(bootstrap)
+
+    # Sync endpoints run in anyio's threadpool; size it to the connection pool
+    # so excess requests queue on the event loop instead of blocking threads
+    # on pool checkout.
+    threadpool_size = settings.THREADPOOL_SIZE
+    if threadpool_size is None and not IS_SQLITE:
+        threadpool_size = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    if threadpool_size:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = threadpool_size
 
     yield
 
@@ -1,26 +1,46 @@
 """Election, Candidate, and Voter models."""
 
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, UniqueConstraint, Text
-from app.core.database import Base
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, UniqueConstraint, Text, func, select
+from sqlalchemy.orm import relationship, column_property
+from app.core.database import Base, GUID, utcnow
+from app.models.vote import Vote
 
 
 class Election(Base):
     __tablename__ = "elections"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=lambda: str(uuid.uuid4()))
     organization_id = Column(
-        String(36), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True
+        GUID, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True
     )
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     start_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime, nullable=False)
     status = Column(String(20), nullable=False, default="draft")  # draft, active, closed
-    created_by = Column(String(36), ForeignKey("users.id"), nullable=False)
-    created_at = Column(
-        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+    created_by = Column(GUID, ForeignKey("users.id"), nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+
+    # lazy="raise": callers must eager-load (selectinload) so list views never N+1
+    candidates = relationship(
+        "Candidate",
+        back_populates="election",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
+
+    # Correlated COUNT(*) over votes, answerable from the election_id index;
+    # deferred so it is only computed where asked for
+    # (undefer(Election.total_votes)) or on first attribute access.
+    total_votes = column_property(
+        select(func.count())
+        .select_from(Vote)
+        .where(Vote.election_id == id)
+        .correlate_except(Vote)
+        .scalar_subquery(),
+        deferred=True,
     )
 
     def __repr__(self):
@@ -30,15 +50,17 @@ class Election(Base):
 class Candidate(Base):
     __tablename__ = "candidates"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=lambda: str(uuid.uuid4()))
     election_id = Column(
-        String(36), ForeignKey("elections.id", ondelete="CASCADE"), nullable=False, index=True
+        GUID, ForeignKey("elections.id", ondelete="CASCADE"), nullable=False, index=True
     )
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    created_at = Column(
-        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
-    )
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+
+    election = relationship("Election", back_populates="candidates", lazy="raise")
+    # Rows are removed by the ON DELETE CASCADE foreign key, never loaded for it
+    votes = relationship("Vote", back_populates="candidate", passive_deletes=True, lazy="raise")
 
     def __repr__(self):
         return f"<Candidate {self.name}>"
@@ -47,15 +69,17 @@ class Candidate(Base):
 class Voter(Base):
     __tablename__ = "voters"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        GUID, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
     election_id = Column(
-        String(36), ForeignKey("elections.id", ondelete="CASCADE"), nullable=False, index=True
+        GUID, ForeignKey("elections.id", ondelete="CASCADE"), nullable=False, index=True
     )
     is_eligible = Column(Boolean, default=True, nullable=False)
 
+    user = relationship("User", back_populates="voter_registrations", lazy="raise")
+
     __table_args__ = (
         UniqueConstraint("user_id", "election_id", name="uq_voter_election"),
     )
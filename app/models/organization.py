@@ -1,21 +1,18 @@
 """Organization model."""
 
 import uuid
-from datetime import datetime, timezone
 from sqlalchemy import Column, String, DateTime, ForeignKey
-from app.core.database import Base
+from app.core.database import Base, GUID, utcnow
 
 
 class Organization(Base):
     __tablename__ = "organizations"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(255), nullable=False)
     description = Column(String(500), nullable=True)
-    created_by = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
-    created_at = Column(
-        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
-    )
+    created_by = Column(GUID, ForeignKey("users.id"), nullable=False, index=True)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     def __repr__(self):
         return f"<Organization {self.name}>"
@@ -1,8 +1,9 @@
 """Role and UserRole models."""
 
 import uuid
-from sqlalchemy import Column, String, Integer, ForeignKey
-from app.core.database import Base
+from sqlalchemy import Column, String, Integer, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from app.core.database import Base, GUID
 
 
 class Role(Base):
@@ -11,6 +12,9 @@ class Role(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(50), unique=True, nullable=False)
 
+    users = relationship("User", secondary="user_roles", back_populates="roles", viewonly=True)
+    user_roles = relationship("UserRole", back_populates="role", passive_deletes=True, lazy="raise")
+
     def __repr__(self):
         return f"<Role {self.name}>"
 
@@ -18,9 +22,18 @@ class Role(Base):
 class UserRole(Base):
     __tablename__ = "user_roles"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(GUID, primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(GUID, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     role_id = Column(Integer, ForeignKey("roles.id", ondelete="CASCADE"), nullable=False, index=True)
 
+    role = relationship("Role", back_populates="user_roles", lazy="raise")
+
+    # Composite key backs "does user X hold role Y" probes, forbids duplicate
+    # grants, and answers "roles of user X" from the index alone (role_id is
+    # its second column), so user_id needs no separate index
+    __table_args__ = (
+        Index("uq_user_role", "user_id", "role_id", unique=True),
+    )
+
     def __repr__(self):
         return f"<UserRole user={self.user_id} role={self.role_id}>"
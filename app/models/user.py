@@ -1,22 +1,26 @@
 """User model."""
 
 import uuid
-from datetime import datetime, timezone
 from sqlalchemy import Column, String, Boolean, DateTime
-from app.core.database import Base
+from sqlalchemy.orm import relationship
+from app.core.database import Base, GUID, utcnow
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=lambda: str(uuid.uuid4()))
     email = Column(String(255), unique=True, nullable=False, index=True)
     emp_id = Column(String(50), unique=True, nullable=True, index=True)
     password_hash = Column(String(255), nullable=False)
     full_name = Column(String(255), nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(
-        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+
+    # Read-only view over the user_roles association; writes go through UserRole.
+    roles = relationship("Role", secondary="user_roles", back_populates="users", viewonly=True)
+    voter_registrations = relationship(
+        "Voter", back_populates="user", passive_deletes=True, lazy="raise"
     )
 
     def __repr__(self):
@@ -1,30 +1,54 @@
-"""Vote model — anonymous, no user_id stored."""
+"""Vote model — anonymous, no user_id stored — and materialized election results."""
 
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, ForeignKey, UniqueConstraint
-from app.core.database import Base
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.orm import relationship
+from app.core.database import Base, GUID, utcnow
 
 
 class Vote(Base):
     __tablename__ = "votes"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=lambda: str(uuid.uuid4()))
     election_id = Column(
-        String(36), ForeignKey("elections.id", ondelete="CASCADE"), nullable=False, index=True
+        GUID, ForeignKey("elections.id", ondelete="CASCADE"), nullable=False, index=True
     )
     candidate_id = Column(
-        String(36), ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False, index=True
+        GUID, ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False, index=True
     )
     hashed_voter_token = Column(String(64), nullable=False, index=True)
-    created_at = Column(
-        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
-    )
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+
+    candidate = relationship("Candidate", back_populates="votes", lazy="raise")
 
     # CRITICAL: Unique constraint prevents duplicate votes per election
     __table_args__ = (
         UniqueConstraint("election_id", "hashed_voter_token", name="uq_vote_election_token"),
+        # Covers per-election totals and per-candidate GROUP BY without touching the table
+        Index("ix_votes_election_candidate", "election_id", "candidate_id"),
     )
 
     def __repr__(self):
         return f"<Vote election={self.election_id}>"
+
+
+class ElectionResult(Base):
+    """Per-candidate vote tally, written once when an election is closed."""
+
+    __tablename__ = "election_results"
+
+    id = Column(GUID, primary_key=True, default=lambda: str(uuid.uuid4()))
+    election_id = Column(
+        GUID, ForeignKey("elections.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    candidate_id = Column(
+        GUID, ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False
+    )
+    vote_count = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("election_id", "candidate_id", name="uq_result_election_candidate"),
+    )
+
+    def __repr__(self):
+        return f"<ElectionResult election={self.election_id} candidate={self.candidate_id}>"
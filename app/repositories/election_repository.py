@@ -1,79 +1,182 @@
 """Repository layer for Election, Candidate, and Voter database operations."""
 
-from typing import Optional, List
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Optional, List, Tuple
+from sqlalchemy import DateTime, bindparam, func, select, text, update
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload, undefer
 
+from app.core.database import GUID, IS_POSTGRES
 from app.models.election import Election, Candidate, Voter
 
+# Loader options for elections that will be rendered as ElectionResponse: vote
+# totals and candidates in one extra query, and any other relationship raises.
+_ELECTION_LOAD_OPTIONS = (
+    undefer(Election.total_votes),
+    selectinload(Election.candidates),
+    raiseload("*"),
+)
+
+# List views show candidate counts, not candidate descriptions; skip those Text
+# columns (and raise if anything tries to lazy-load one per row).
+_ELECTION_LIST_OPTIONS = (
+    undefer(Election.total_votes),
+    selectinload(Election.candidates).defer(Candidate.description, raiseload=True),
+    raiseload("*"),
+)
+
+# Vote-path eligibility check, prebuilt as text() so each cast skips ORM
+# statement compilation (see vote_repository for the vote statements). It also
+# rejects voters holding a legacy-format token (security.legacy_vote_token),
+# which the ON CONFLICT insert cannot see.
+# On PostgreSQL the election row is share-locked until the vote commits, so
+# close_election's status UPDATE waits for votes already past this check
+# before it tallies, and votes queued behind the close re-check and see it
+# closed. SQLite (development only) has no row locks to take.
+_IS_VOTABLE = text(
+    "SELECT candidates.id FROM candidates "
+    "JOIN elections ON elections.id = candidates.election_id "
+    "WHERE candidates.id = :candidate_id AND elections.id = :election_id "
+    "AND elections.status = 'active' "
+    "AND elections.start_time <= :now AND elections.end_time >= :now "
+    "AND NOT EXISTS (SELECT 1 FROM votes WHERE votes.election_id = :election_id "
+    "AND votes.hashed_voter_token = :legacy_token)"
+    + (" FOR SHARE OF elections" if IS_POSTGRES else "")
+).bindparams(
+    bindparam("candidate_id", type_=GUID),
+    bindparam("election_id", type_=GUID),
+    bindparam("now", type_=DateTime),
+)
+
 
 class ElectionRepository:
     """Data access for Election operations."""
 
+    # Columns callers may change through update(); anything else is ignored
+    _UPDATABLE = frozenset({"title", "description", "start_time", "end_time"})
+
     @staticmethod
     def create(db: Session, **kwargs) -> Election:
         election = Election(**kwargs)
         db.add(election)
-        db.commit()
-        db.refresh(election)
+        db.flush()
         return election
 
     @staticmethod
     def get_by_id(db: Session, election_id: str) -> Optional[Election]:
-        return db.query(Election).filter(Election.id == election_id).first()
+        return db.get(Election, election_id)
+
+    @staticmethod
+    def get_by_id_with_candidates(db: Session, election_id: str) -> Optional[Election]:
+        return db.scalars(
+            select(Election).options(*_ELECTION_LOAD_OPTIONS).where(Election.id == election_id)
+        ).first()
+
+    @staticmethod
+    def get_with_candidate_count(db: Session, election_id: str) -> Optional[Tuple[Election, int]]:
+        """Fetch an election and how many candidates it has in one query."""
+        candidate_count = (
+            select(func.count())
+            .select_from(Candidate)
+            .where(Candidate.election_id == Election.id)
+            .scalar_subquery()
+        )
+        return db.execute(
+            select(Election, candidate_count).where(Election.id == election_id)
+        ).first()
+
+    @staticmethod
+    def is_votable(
+        db: Session, election_id: str, candidate_id: str, now: datetime, legacy_token: str
+    ) -> bool:
+        """True if the candidate belongs to the election and it is active at ``now``.
+
+        Also False if the election already holds ``legacy_token``. Checks
+        everything in one prebuilt statement and fetches a single id, so the
+        common case needs no ORM objects. ``now`` is naive UTC, like the stored times.
+        """
+        return db.scalar(_IS_VOTABLE, {
+            "candidate_id": candidate_id,
+            "election_id": election_id,
+            "now": now,
+            "legacy_token": legacy_token,
+        }) is not None
 
     @staticmethod
     def get_all(db: Session, skip: int = 0, limit: int = 100) -> List[Election]:
-        return db.query(Election).offset(skip).limit(limit).all()
+        return db.scalars(
+            select(Election).options(*_ELECTION_LIST_OPTIONS).offset(skip).limit(limit)
+        ).all()
 
     @staticmethod
     def get_by_organization(db: Session, org_id: str) -> List[Election]:
-        return db.query(Election).filter(Election.organization_id == org_id).all()
+        return db.scalars(
+            select(Election).options(*_ELECTION_LIST_OPTIONS).where(Election.organization_id == org_id)
+        ).all()
 
     @staticmethod
     def update(db: Session, election: Election, **kwargs) -> Election:
         for key, value in kwargs.items():
-            if value is not None and hasattr(election, key):
+            if value is not None and key in ElectionRepository._UPDATABLE:
                 setattr(election, key, value)
-        db.commit()
-        db.refresh(election)
+        db.flush()
         return election
 
     @staticmethod
     def update_status(db: Session, election: Election, status: str) -> Election:
         election.status = status
-        db.commit()
-        db.refresh(election)
+        db.flush()
         return election
 
+    @staticmethod
+    def transition_status(db: Session, election: Election, current: str, new: str) -> bool:
+        """Move the election from ``current`` to ``new`` status; False if it was not in ``current``.
+
+        A conditional UPDATE, so of two concurrent transitions only one matches
+        the row; the other re-checks the committed status and updates nothing.
+        """
+        result = db.execute(
+            update(Election)
+            .where(Election.id == election.id, Election.status == current)
+            .values(status=new)
+        )
+        return result.rowcount == 1
+
     @staticmethod
     def delete(db: Session, election: Election) -> None:
         db.delete(election)
-        db.commit()
+        db.flush()
 
 
 class CandidateRepository:
     """Data access for Candidate operations."""
 
     @staticmethod
-    def create(db: Session, election_id: str, name: str, description: Optional[str] = None) -> Candidate:
+    def create(db: Session, election_id: str, name: str,
+               description: Optional[str] = None) -> Candidate:
         candidate = Candidate(election_id=election_id, name=name, description=description)
         db.add(candidate)
-        db.commit()
-        db.refresh(candidate)
+        db.flush()
         return candidate
 
     @staticmethod
     def get_by_id(db: Session, candidate_id: str) -> Optional[Candidate]:
-        return db.query(Candidate).filter(Candidate.id == candidate_id).first()
+        return db.get(Candidate, candidate_id)
+
+    @staticmethod
+    def get_with_election(db: Session, candidate_id: str) -> Optional[Candidate]:
+        """Fetch a candidate with its election joined in, for status checks."""
+        return db.scalars(
+            select(Candidate).options(joinedload(Candidate.election)).where(Candidate.id == candidate_id)
+        ).first()
 
     @staticmethod
     def get_by_election(db: Session, election_id: str) -> List[Candidate]:
-        return db.query(Candidate).filter(Candidate.election_id == election_id).all()
+        return db.scalars(select(Candidate).where(Candidate.election_id == election_id)).all()
 
     @staticmethod
     def delete(db: Session, candidate: Candidate) -> None:
         db.delete(candidate)
-        db.commit()
+        db.flush()
 
 
 class VoterRepository:
@@ -83,23 +186,20 @@ class VoterRepository:
     def add_voter(db: Session, user_id: str, election_id: str) -> Voter:
         voter = Voter(user_id=user_id, election_id=election_id, is_eligible=True)
         db.add(voter)
-        db.commit()
-        db.refresh(voter)
+        db.flush()
         return voter
 
     @staticmethod
     def get_voter(db: Session, user_id: str, election_id: str) -> Optional[Voter]:
-        return (
-            db.query(Voter)
-            .filter(Voter.user_id == user_id, Voter.election_id == election_id)
-            .first()
-        )
+        return db.scalars(
+            select(Voter).where(Voter.user_id == user_id, Voter.election_id == election_id)
+        ).first()
 
     @staticmethod
     def get_voters_for_election(db: Session, election_id: str) -> List[Voter]:
-        return db.query(Voter).filter(Voter.election_id == election_id).all()
+        return db.scalars(select(Voter).where(Voter.election_id == election_id)).all()
 
     @staticmethod
     def remove_voter(db: Session, voter: Voter) -> None:
         db.delete(voter)
-        db.commit()
+        db.flush()
@@ -1,44 +1,56 @@
 """Repository layer for Organization database operations."""
 
 from typing import Optional, List
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Session
 
 from app.models.organization import Organization
 
+# Columns rendered by OrganizationResponse. Read-only list views select these as
+# plain rows, which the schema reads by attribute, and skip building ORM objects.
+_ORG_COLUMNS = (
+    Organization.id,
+    Organization.name,
+    Organization.description,
+    Organization.created_by,
+    Organization.created_at,
+)
+
 
 class OrganizationRepository:
     """Data access for Organization operations."""
 
+    # Columns callers may change through update(); anything else is ignored
+    _UPDATABLE = frozenset({"name", "description"})
+
     @staticmethod
     def create(db: Session, name: str, description: Optional[str], created_by: str) -> Organization:
         org = Organization(name=name, description=description, created_by=created_by)
         db.add(org)
-        db.commit()
-        db.refresh(org)
+        db.flush()
         return org
 
     @staticmethod
     def get_by_id(db: Session, org_id: str) -> Optional[Organization]:
-        return db.query(Organization).filter(Organization.id == org_id).first()
+        return db.get(Organization, org_id)
 
     @staticmethod
-    def get_all(db: Session, skip: int = 0, limit: int = 100) -> List[Organization]:
-        return db.query(Organization).offset(skip).limit(limit).all()
+    def get_all(db: Session, skip: int = 0, limit: int = 100) -> List[Row]:
+        return db.execute(select(*_ORG_COLUMNS).offset(skip).limit(limit)).all()
 
     @staticmethod
-    def get_by_creator(db: Session, user_id: str) -> List[Organization]:
-        return db.query(Organization).filter(Organization.created_by == user_id).all()
+    def get_by_creator(db: Session, user_id: str) -> List[Row]:
+        return db.execute(select(*_ORG_COLUMNS).where(Organization.created_by == user_id)).all()
 
     @staticmethod
     def update(db: Session, org: Organization, **kwargs) -> Organization:
         for key, value in kwargs.items():
-            if value is not None and hasattr(org, key):
+            if value is not None and key in OrganizationRepository._UPDATABLE:
                 setattr(org, key, value)
-        db.commit()
-        db.refresh(org)
+        db.flush()
         return org
 
     @staticmethod
     def delete(db: Session, org: Organization) -> None:
         db.delete(org)
-        db.commit()
+        db.flush()
@@ -1,8 +1,12 @@
 """Repository layer for User and Role database operations."""
 
-from typing import Optional, List
-from sqlalchemy.orm import Session
+import uuid
+from typing import Dict, Optional, List
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session, selectinload
 
+from app.core.cache import get_cached_role_ids, cache_role_ids
+from app.core.database import dialect_insert
 from app.models.user import User
 from app.models.role import Role, UserRole
 
@@ -10,98 +14,127 @@ from app.models.role import Role, UserRole
 class UserRepository:
     """Data access for User operations."""
 
+    # Columns callers may change through update(); anything else is ignored
+    _UPDATABLE = frozenset({"email", "emp_id", "password_hash", "full_name", "is_active"})
+
     @staticmethod
-    def create(db: Session, email: str, password_hash: str, full_name: Optional[str] = None, emp_id: Optional[str] = None) -> User:
+    def create(db: Session, email: str, password_hash: str, full_name: Optional[str] = None,
+               emp_id: Optional[str] = None) -> User:
         user = User(email=email, password_hash=password_hash, full_name=full_name, emp_id=emp_id)
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        db.flush()
         return user
 
     @staticmethod
     def get_by_id(db: Session, user_id: str) -> Optional[User]:
-        return db.query(User).filter(User.id == user_id).first()
+        return db.get(User, user_id)
+
+    @staticmethod
+    def get_emp_id(db: Session, user_id: str) -> Optional[str]:
+        """Return just the user's employee ID.
+
+        Uses the session's copy of the user when it is already loaded (the
+        authenticated user always is); otherwise selects the single column.
+        """
+        user = db.identity_map.get(db.identity_key(User, user_id))
+        if user is not None:
+            return user.emp_id
+        return db.scalar(select(User.emp_id).where(User.id == user_id))
 
     @staticmethod
     def get_by_email(db: Session, email: str) -> Optional[User]:
-        return db.query(User).filter(User.email == email).first()
+        return db.scalars(select(User).where(User.email == email)).first()
 
     @staticmethod
     def get_by_emp_id(db: Session, emp_id: str) -> Optional[User]:
-        return db.query(User).filter(User.emp_id == emp_id).first()
+        return db.scalars(select(User).where(User.emp_id == emp_id)).first()
 
     @staticmethod
     def get_all(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
-        return db.query(User).offset(skip).limit(limit).all()
+        return db.scalars(select(User).offset(skip).limit(limit)).all()
+
+    @staticmethod
+    def get_all_with_roles(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
+        return db.scalars(
+            select(User).options(selectinload(User.roles)).offset(skip).limit(limit)
+        ).all()
 
     @staticmethod
     def update(db: Session, user: User, **kwargs) -> User:
+        """Apply changes and flush.
+
+        The caller commits and then calls ``invalidate_user(user.id)``;
+        invalidating before the commit lets a concurrent request re-cache the
+        old row.
+        """
         for key, value in kwargs.items():
-            if value is not None and hasattr(user, key):
+            if value is not None and key in UserRepository._UPDATABLE:
                 setattr(user, key, value)
-        db.commit()
-        db.refresh(user)
+        db.flush()
         return user
 
     @staticmethod
     def get_user_roles(db: Session, user_id: str) -> List[str]:
-        roles = (
-            db.query(Role.name)
-            .join(UserRole, UserRole.role_id == Role.id)
-            .filter(UserRole.user_id == user_id)
-            .all()
-        )
-        return [r.name for r in roles]
+        role_ids = db.scalars(select(UserRole.role_id).where(UserRole.user_id == user_id)).all()
+        names = {role_id: name for name, role_id in RoleRepository.get_ids(db).items()}
+        if any(role_id not in names for role_id in role_ids):
+            names = {role_id: name for name, role_id in RoleRepository.get_ids(db, reload=True).items()}
+        return [names[role_id] for role_id in role_ids if role_id in names]
 
     @staticmethod
     def assign_role(db: Session, user_id: str, role_name: str) -> bool:
-        role = db.query(Role).filter(Role.name == role_name).first()
-        if not role:
+        """Grant a role by name in one INSERT; False if the role does not exist."""
+        role_id = RoleRepository.get_id(db, role_name)
+        if role_id is None:
             return False
-
-        existing = (
-            db.query(UserRole)
-            .filter(UserRole.user_id == user_id, UserRole.role_id == role.id)
-            .first()
+        db.execute(
+            dialect_insert(UserRole)
+            .values(id=str(uuid.uuid4()), user_id=user_id, role_id=role_id)
+            .on_conflict_do_nothing(index_elements=["user_id", "role_id"])
         )
-        if existing:
-            return True  # Already assigned
-
-        user_role = UserRole(user_id=user_id, role_id=role.id)
-        db.add(user_role)
-        db.commit()
         return True
 
     @staticmethod
     def remove_role(db: Session, user_id: str, role_name: str) -> bool:
-        role = db.query(Role).filter(Role.name == role_name).first()
-        if not role:
+        """Revoke a role by name in one DELETE; True if a grant was removed."""
+        role_id = RoleRepository.get_id(db, role_name)
+        if role_id is None:
             return False
-
-        user_role = (
-            db.query(UserRole)
-            .filter(UserRole.user_id == user_id, UserRole.role_id == role.id)
-            .first()
+        result = db.execute(
+            delete(UserRole).where(UserRole.user_id == user_id, UserRole.role_id == role_id)
         )
-        if user_role:
-            db.delete(user_role)
-            db.commit()
-        return True
+        return result.rowcount > 0
 
 
 class RoleRepository:
     """Data access for Role operations."""
 
+    @staticmethod
+    def get_ids(db: Session, reload: bool = False) -> Dict[str, int]:
+        """Role name -> id map, loaded from the database once per worker."""
+        role_ids = get_cached_role_ids()
+        if reload or not role_ids:
+            role_ids = dict(db.execute(select(Role.name, Role.id)).all())
+            cache_role_ids(role_ids)
+        return role_ids
+
+    @staticmethod
+    def get_id(db: Session, name: str) -> Optional[int]:
+        role_ids = RoleRepository.get_ids(db)
+        if name not in role_ids:
+            role_ids = RoleRepository.get_ids(db, reload=True)
+        return role_ids.get(name)
+
     @staticmethod
     def get_or_create(db: Session, name: str) -> Role:
-        role = db.query(Role).filter(Role.name == name).first()
-        if not role:
-            role = Role(name=name)
-            db.add(role)
-            db.commit()
-            db.refresh(role)
+        role_id = RoleRepository.get_id(db, name)
+        if role_id is not None:
+            return db.get(Role, role_id)
+        role = Role(name=name)
+        db.add(role)
+        db.flush()
         return role
 
     @staticmethod
     def get_all(db: Session) -> List[Role]:
-        return db.query(Role).all()
+        return db.scalars(select(Role)).all()
@@ -1,63 +1,109 @@
 """Repository layer for Vote database operations."""
 
-from typing import Optional, List, Tuple
+import uuid
+from datetime import datetime
+from typing import List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import DateTime, and_, bindparam, func, select, text
 
-from app.models.vote import Vote
+from app.core.database import GUID
+from app.models.vote import Vote, ElectionResult
 from app.models.election import Candidate
 
+# The vote path runs these on every cast / status poll. As prebuilt text()
+# statements they skip ORM statement compilation and cache-key generation;
+# GUID-typed binds keep the same UUID handling as the mapped columns.
+# ON CONFLICT ... DO NOTHING is the same syntax on SQLite and PostgreSQL.
+_INSERT_VOTE = text(
+    "INSERT INTO votes (id, election_id, candidate_id, hashed_voter_token, created_at) "
+    "VALUES (:id, :election_id, :candidate_id, :token, :created_at) "
+    "ON CONFLICT (election_id, hashed_voter_token) DO NOTHING"
+).bindparams(
+    bindparam("id", type_=GUID),
+    bindparam("election_id", type_=GUID),
+    bindparam("candidate_id", type_=GUID),
+    bindparam("created_at", type_=DateTime),
+)
+
+_VOTE_EXISTS = text(
+    "SELECT EXISTS (SELECT 1 FROM votes "
+    "WHERE election_id = :election_id AND hashed_voter_token IN (:token, :legacy_token))"
+).bindparams(bindparam("election_id", type_=GUID))
+
 
 class VoteRepository:
     """Data access for Vote operations — maintains anonymity."""
 
     @staticmethod
-    def cast_vote(
+    def cast_vote_atomic(
         db: Session,
         election_id: str,
         candidate_id: str,
         hashed_voter_token: str,
-    ) -> Vote:
-        vote = Vote(
-            election_id=election_id,
-            candidate_id=candidate_id,
-            hashed_voter_token=hashed_voter_token,
-        )
-        db.add(vote)
-        db.commit()
-        db.refresh(vote)
-        return vote
+        created_at: datetime,
+    ) -> bool:
+        """Insert a vote unless this token already voted; True if a row was inserted.
+
+        A single INSERT ... ON CONFLICT DO NOTHING on uq_vote_election_token, so
+        there is no window between a duplicate check and the insert.
+        """
+        result = db.execute(_INSERT_VOTE, {
+            "id": str(uuid.uuid4()),
+            "election_id": election_id,
+            "candidate_id": candidate_id,
+            "token": hashed_voter_token,
+            "created_at": created_at,
+        })
+        return result.rowcount == 1
 
     @staticmethod
-    def check_duplicate(db: Session, election_id: str, hashed_voter_token: str) -> bool:
-        """Check if a vote with this token already exists for this election."""
-        existing = (
-            db.query(Vote)
-            .filter(
-                Vote.election_id == election_id,
-                Vote.hashed_voter_token == hashed_voter_token,
-            )
-            .first()
-        )
-        return existing is not None
+    def check_duplicate(
+        db: Session, election_id: str, hashed_voter_token: str, legacy_token: str
+    ) -> bool:
+        """Check if a vote with this token, or its legacy form, exists for this election.
+
+        SELECT EXISTS over uq_vote_election_token: index probes, no row built.
+        """
+        return bool(db.scalar(_VOTE_EXISTS, {
+            "election_id": election_id,
+            "token": hashed_voter_token,
+            "legacy_token": legacy_token,
+        }))
 
     @staticmethod
     def get_results(db: Session, election_id: str) -> List[Tuple[str, str, int]]:
-        """Get vote counts per candidate for an election."""
-        results = (
-            db.query(
-                Candidate.id,
-                Candidate.name,
-                func.count(Vote.id).label("vote_count"),
+        """Get vote counts per candidate for an election.
+
+        Joins and counts only (election_id, candidate_id), so the votes side is
+        answered from ix_votes_election_candidate without visiting the table.
+        """
+        vote_count = func.count(Vote.candidate_id)
+        return db.execute(
+            select(Candidate.id, Candidate.name, vote_count.label("vote_count"))
+            .outerjoin(
+                Vote,
+                and_(Vote.election_id == Candidate.election_id, Vote.candidate_id == Candidate.id),
             )
-            .outerjoin(Vote, Vote.candidate_id == Candidate.id)
-            .filter(Candidate.election_id == election_id)
+            .where(Candidate.election_id == election_id)
             .group_by(Candidate.id, Candidate.name)
-            .order_by(func.count(Vote.id).desc())
-            .all()
+            .order_by(vote_count.desc())
+        ).all()
+
+    @staticmethod
+    def save_results(db: Session, election_id: str, results: List[Tuple[str, str, int]]) -> None:
+        """Materialize per-candidate tallies for a closed election."""
+        db.add_all(
+            ElectionResult(election_id=election_id, candidate_id=r[0], vote_count=r[2])
+            for r in results
         )
-        return results
+        db.flush()
 
     @staticmethod
-    def get_total_votes(db: Session, election_id: str) -> int:
-        return db.query(func.count(Vote.id)).filter(Vote.election_id == election_id).scalar() or 0
+    def get_saved_results(db: Session, election_id: str) -> List[Tuple[str, str, int]]:
+        """Read materialized tallies, in the same shape as get_results."""
+        return db.execute(
+            select(Candidate.id, Candidate.name, ElectionResult.vote_count)
+            .join(ElectionResult, ElectionResult.candidate_id == Candidate.id)
+            .where(ElectionResult.election_id == election_id)
+            .order_by(ElectionResult.vote_count.desc())
+        ).all()
@@ -34,10 +34,13 @@ class AuthService:
                 )
 
         password_hash = hash_password(password)
-        user = UserRepository.create(db, email=email, password_hash=password_hash, full_name=full_name, emp_id=emp_id)
+        user = UserRepository.create(
+            db, email=email, password_hash=password_hash, full_name=full_name, emp_id=emp_id
+        )
 
-        # Assign default VOTER role
+        # Assign default VOTER role; user and role are committed together
         UserRepository.assign_role(db, user.id, "VOTER")
+        db.commit()
 
         roles = UserRepository.get_user_roles(db, user.id)
         return user, roles
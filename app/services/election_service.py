@@ -3,12 +3,24 @@
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.core.cache import invalidate_election_list, invalidate_results
 from app.repositories.election_repository import (
     ElectionRepository,
     CandidateRepository,
     VoterRepository,
 )
 from app.repositories.organization_repository import OrganizationRepository
+from app.repositories.user_repository import UserRepository
+from app.repositories.vote_repository import VoteRepository
+
+
+def _require_status(election, required: str, detail: str) -> None:
+    """Reject the request with 400 unless the election is in ``required`` status."""
+    if election.status != required:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail,
+        )
 
 
 class ElectionService:
@@ -29,7 +41,7 @@ class ElectionService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="End time must be after start time",
             )
-        return ElectionRepository.create(
+        election = ElectionRepository.create(
             db,
             organization_id=organization_id,
             title=title,
@@ -38,10 +50,13 @@ class ElectionService:
             end_time=end_time,
             created_by=created_by,
         )
+        db.commit()
+        invalidate_election_list()
+        return election
 
     @staticmethod
     def get_election(db: Session, election_id: str):
-        election = ElectionRepository.get_by_id(db, election_id)
+        election = ElectionRepository.get_by_id_with_candidates(db, election_id)
         if not election:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -65,33 +80,31 @@ class ElectionService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Election not found",
             )
-        if election.status != "draft":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Can only update elections in draft status",
-            )
-        return ElectionRepository.update(db, election, **kwargs)
+        _require_status(election, "draft", "Can only update elections in draft status")
+        election = ElectionRepository.update(db, election, **kwargs)
+        db.commit()
+        invalidate_election_list()
+        return election
 
     @staticmethod
     def activate_election(db: Session, election_id: str):
-        election = ElectionRepository.get_by_id(db, election_id)
-        if not election:
+        row = ElectionRepository.get_with_candidate_count(db, election_id)
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Election not found",
             )
-        if election.status != "draft":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Can only activate elections in draft status",
-            )
-        candidates = CandidateRepository.get_by_election(db, election_id)
-        if len(candidates) < 2:
+        election, candidate_count = row
+        _require_status(election, "draft", "Can only activate elections in draft status")
+        if candidate_count < 2:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Election must have at least 2 candidates to activate",
             )
-        return ElectionRepository.update_status(db, election, "active")
+        election = ElectionRepository.update_status(db, election, "active")
+        db.commit()
+        invalidate_election_list()
+        return election
 
     @staticmethod
     def close_election(db: Session, election_id: str):
@@ -101,12 +114,24 @@ class ElectionService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Election not found",
             )
-        if election.status != "active":
+        _require_status(election, "active", "Can only close active elections")
+        # Tallies are final once closed; store them in the same transaction as
+        # the status change so a closed election is never seen without them.
+        # The UPDATE waits on votes holding is_votable's share lock (PostgreSQL),
+        # so the tally below sees every vote accepted while the election was active.
+        # It only matches an active election, so of two concurrent closes one
+        # wins and the other is refused before it tallies.
+        if not ElectionRepository.transition_status(db, election, "active", "closed"):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Can only close active elections",
             )
-        return ElectionRepository.update_status(db, election, "closed")
+        results = VoteRepository.get_results(db, election_id)
+        VoteRepository.save_results(db, election_id, results)
+        db.commit()
+        invalidate_results(election_id)
+        invalidate_election_list()
+        return election
 
     @staticmethod
     def delete_election(db: Session, election_id: str):
@@ -117,12 +142,11 @@ class ElectionService:
                 detail="Election not found",
             )
         # only closed elections may be removed; drafts should be edited instead
-        if election.status != "closed":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only closed elections can be deleted",
-            )
+        _require_status(election, "closed", "Only closed elections can be deleted")
         ElectionRepository.delete(db, election)
+        db.commit()
+        invalidate_election_list()
+        invalidate_results(election_id)
         return {"message": "Election deleted"}
 
     # --- Candidates ---
@@ -134,12 +158,11 @@ class ElectionService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Election not found",
             )
-        if election.status != "draft":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Can only add candidates to draft elections",
-            )
-        return CandidateRepository.create(db, election_id=election_id, name=name, description=description)
+        _require_status(election, "draft", "Can only add candidates to draft elections")
+        candidate = CandidateRepository.create(db, election_id=election_id, name=name, description=description)
+        db.commit()
+        invalidate_election_list()
+        return candidate
 
     @staticmethod
     def get_candidates(db: Session, election_id: str):
@@ -147,19 +170,16 @@ class ElectionService:
 
     @staticmethod
     def delete_candidate(db: Session, candidate_id: str):
-        candidate = CandidateRepository.get_by_id(db, candidate_id)
+        candidate = CandidateRepository.get_with_election(db, candidate_id)
         if not candidate:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Candidate not found",
             )
-        election = ElectionRepository.get_by_id(db, candidate.election_id)
-        if election and election.status != "draft":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Can only remove candidates from draft elections",
-            )
+        _require_status(candidate.election, "draft", "Can only remove candidates from draft elections")
         CandidateRepository.delete(db, candidate)
+        db.commit()
+        invalidate_election_list()
         return {"message": "Candidate removed"}
 
     # --- Voters ---
@@ -172,24 +192,21 @@ class ElectionService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Election not found",
             )
-        # try to fetch by id first
-        user = UserRepository.get_by_id(db, user_id)
+        # try the UUID first, then the employee ID
+        user = UserRepository.get_by_id(db, user_id) or UserRepository.get_by_emp_id(db, user_id)
         if not user:
-            # attempt lookup by emp_id
-            user = UserRepository.get_by_emp_id(db, user_id)
-            if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="User not found",
-                )
-        actual_id = user.id
-        existing = VoterRepository.get_voter(db, actual_id, election_id)
-        if existing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+        if VoterRepository.get_voter(db, user.id, election_id):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User is already registered as a voter for this election",
             )
-        return VoterRepository.add_voter(db, user_id=actual_id, election_id=election_id)
+        voter = VoterRepository.add_voter(db, user_id=user.id, election_id=election_id)
+        db.commit()
+        return voter
 
     @staticmethod
     def get_voters(db: Session, election_id: str):
@@ -204,4 +221,5 @@ class ElectionService:
                 detail="Voter not found",
             )
         VoterRepository.remove_voter(db, voter)
+        db.commit()
         return {"message": "Voter removed"}
@@ -11,7 +11,9 @@ class OrganizationService:
 
     @staticmethod
     def create_organization(db: Session, name: str, description: str, created_by: str):
-        return OrganizationRepository.create(db, name=name, description=description, created_by=created_by)
+        org = OrganizationRepository.create(db, name=name, description=description, created_by=created_by)
+        db.commit()
+        return org
 
     @staticmethod
     def get_organization(db: Session, org_id: str):
@@ -45,4 +47,5 @@ class OrganizationService:
                 detail="Only the organization creator can delete it",
             )
         OrganizationRepository.delete(db, org)
+        db.commit()
         return {"message": "Organization deleted"}
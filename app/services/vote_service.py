@@ -1,14 +1,18 @@
 """Service layer for Vote business logic — enforces anonymity and prevents duplicates."""
 
 from datetime import datetime, timezone
+from typing import Optional
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.core.security import generate_vote_token, hash_vote_token
+from app.core.cache import get_cached_results, cache_results
+from app.core.security import generate_vote_token, legacy_vote_token
+from app.repositories.user_repository import UserRepository
 from app.repositories.vote_repository import VoteRepository
+from app.schemas.vote_schema import CandidateResult, ElectionResults
 from app.repositories.election_repository import (
-    ElectionRepository,
     CandidateRepository,
+    ElectionRepository,
     # VoterRepository is no longer needed for eligibility checks
 )
 
@@ -17,18 +21,69 @@ class VoteService:
     """Business logic for voting — 3-level duplicate prevention + anonymity."""
 
     @staticmethod
-    def cast_vote(db: Session, user_id: str, election_id: str, candidate_id: str):
+    def cast_vote(
+        db: Session,
+        user_id: str,
+        election_id: str,
+        candidate_id: str,
+        now: Optional[datetime] = None,
+    ):
         """
         Cast a vote with full validation:
         1. Election must exist and be ACTIVE
         2. Time window check (start_time <= now <= end_time)
-        3. Voter must be eligible
-        4. Candidate must belong to election
-        5. Duplicate vote check via hashed token
-        6. Store anonymous vote
+        3. Candidate must belong to election
+        4. Store anonymous vote, atomically rejecting duplicates by hashed token
+
+        Steps 1-3 (and the legacy-token duplicate check) run as one query.
+        Voter eligibility is implicit: every registered user may vote.
         """
 
-        # 1. Election exists?
+        # Generate the anonymous vote token, plus the form votes stored before
+        # tokens were kept as-is (checked until those elections have closed)
+        hashed_token = generate_vote_token(VoteService._voter_identifier(db, user_id), election_id)
+        legacy_token = legacy_vote_token(hashed_token)
+
+        # 1-3. One query answers "may this candidate receive a vote now?"; the
+        # election is only loaded to explain a refusal. Election times are
+        # stored as naive UTC, so compare against a naive copy of the clock.
+        if now is None:
+            now = datetime.now(timezone.utc)
+        naive_now = now.replace(tzinfo=None)
+        if not ElectionRepository.is_votable(db, election_id, candidate_id, naive_now, legacy_token):
+            VoteService._reject_vote(db, election_id, candidate_id, naive_now)
+
+        # 4. Cast the anonymous vote; the unique token constraint rejects duplicates
+        if not VoteRepository.cast_vote_atomic(db, election_id, candidate_id, hashed_token, naive_now):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="You have already voted in this election",
+            )
+        db.commit()
+
+        return {
+            "message": "Vote cast successfully",
+            "election_id": election_id,
+            "voted_at": now,
+        }
+
+    @staticmethod
+    def _voter_identifier(db: Session, user_id: str) -> str:
+        """Stable identifier behind a user's vote token.
+
+        If the user has an employee ID (our "meaningful id"/AI identifier), use it
+        instead of the UUID so that the same person cannot vote twice even if
+        they created multiple accounts.
+        """
+        return UserRepository.get_emp_id(db, user_id) or user_id
+
+    @staticmethod
+    def _reject_vote(db: Session, election_id: str, candidate_id: str, now: datetime):
+        """Raise the HTTP error explaining why a vote cannot be cast.
+
+        ``now`` is naive UTC, matching the stored election times.
+        """
+        # 1. Election exists and is active?
         election = ElectionRepository.get_by_id(db, election_id)
         if not election:
             raise HTTPException(
@@ -36,29 +91,25 @@ class VoteService:
                 detail="Election not found",
             )
 
-        # 2. Election status check
         if election.status != "active":
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Election is not active (current status: {election.status})",
             )
 
-        # 3. Time window check
-        now = datetime.now(timezone.utc)
-        if now < election.start_time.replace(tzinfo=timezone.utc):
+        # 2. Time window check
+        if now < election.start_time:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Election has not started yet",
             )
-        if now > election.end_time.replace(tzinfo=timezone.utc):
+        if now > election.end_time:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Election has ended",
             )
 
-        # 4. Voter eligibility is implicit; all registered users may vote.  No per-
-        # election check required.
-        # 5. Candidate belongs to election?
+        # 3. Candidate belongs to election?
         candidate = CandidateRepository.get_by_id(db, candidate_id)
         if not candidate or candidate.election_id != election_id:
             raise HTTPException(
@@ -66,37 +117,19 @@ class VoteService:
                 detail="Invalid candidate for this election",
             )
 
-        # 6. Determine identifier for anonymous token. If user has an employee ID
-        # (our "meaningful id"/AI identifier), use it instead of UUID so that the
-        # same person cannot vote twice even if they created multiple accounts.
-        user = None
-        from app.repositories.user_repository import UserRepository
-        user = UserRepository.get_by_id(db, user_id)
-        identifier = user.emp_id if user and user.emp_id else user_id
-
-        # 7. Generate anonymous vote token
-        vote_token = generate_vote_token(identifier, election_id)
-        hashed_token = hash_vote_token(vote_token)
-
-        # 7. Duplicate check (backend validation)
-        if VoteRepository.check_duplicate(db, election_id, hashed_token):
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="You have already voted in this election",
-            )
-
-        # 8. Cast the anonymous vote
-        vote = VoteRepository.cast_vote(db, election_id, candidate_id, hashed_token)
-
-        return {
-            "message": "Vote cast successfully",
-            "election_id": election_id,
-            "voted_at": vote.created_at,
-        }
+        # Otherwise the voter already has a legacy-format vote in this election
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="You have already voted in this election",
+        )
 
     @staticmethod
     def get_results(db: Session, election_id: str):
         """Get election results — only available for closed elections."""
+        cached = get_cached_results(election_id)
+        if cached is not None:
+            return cached
+
         election = ElectionRepository.get_by_id(db, election_id)
         if not election:
             raise HTTPException(
@@ -110,32 +143,33 @@ class VoteService:
                 detail="Results are only available after the election is closed",
             )
 
-        results = VoteRepository.get_results(db, election_id)
-        total_votes = VoteRepository.get_total_votes(db, election_id)
-
-        return {
-            "election_id": election_id,
-            "title": election.title,
-            "status": election.status,
-            "total_votes": total_votes,
-            "results": [
-                {
-                    "candidate_id": r[0],
-                    "candidate_name": r[1],
-                    "vote_count": r[2],
-                }
+        results = VoteRepository.get_saved_results(db, election_id)
+        if not results:
+            # Closed before tallies were materialized; aggregate the votes directly
+            results = VoteRepository.get_results(db, election_id)
+        total_votes = sum(r[2] for r in results)
+
+        # Validated once here; cache hits hand FastAPI the finished model, so
+        # per-request work is serialization only
+        response = ElectionResults(
+            election_id=election_id,
+            title=election.title,
+            status=election.status,
+            total_votes=total_votes,
+            results=[
+                CandidateResult(candidate_id=r[0], candidate_name=r[1], vote_count=r[2])
                 for r in results
             ],
-        }
+        )
+        # Closed elections are immutable; the cache TTL only covers deletion
+        cache_results(election_id, response)
+        return response
 
     @staticmethod
     def check_vote_status(db: Session, user_id: str, election_id: str):
         """Check if a user has already voted in an election."""
-        # use same identifier logic as cast_vote
-        from app.repositories.user_repository import UserRepository
-        user = UserRepository.get_by_id(db, user_id)
-        identifier = user.emp_id if user and user.emp_id else user_id
-        vote_token = generate_vote_token(identifier, election_id)
-        hashed_token = hash_vote_token(vote_token)
-        has_voted = VoteRepository.check_duplicate(db, election_id, hashed_token)
+        hashed_token = generate_vote_token(VoteService._voter_identifier(db, user_id), election_id)
+        has_voted = VoteRepository.check_duplicate(
+            db, election_id, hashed_token, legacy_vote_token(hashed_token)
+        )
         return {"election_id": election_id, "has_voted": has_voted}
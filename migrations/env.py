@@ -0,0 +1,69 @@
+"""Alembic environment — runs migrations against the app's configured database."""
+
+from logging.config import fileConfig
+
+from alembic import context
+
+from app.core.database import Base, engine
+from app.models import user, role, organization, election, vote  # noqa: F401 — register tables
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """Emit SQL to stdout without connecting to the database."""
+    context.configure(
+        url=str(engine.url),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=engine.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations over a connection from the application engine."""
+    with engine.connect() as connection:
+        is_sqlite = connection.dialect.name == "sqlite"
+        if is_sqlite:
+            # Batch migrations rebuild tables (copy, DROP, rename). With the
+            # app's foreign_keys=ON the DROP either fails on referencing rows
+            # or cascade-deletes them, so enforcement is off for the run. The
+            # pragma is ignored inside a transaction, so set it before one.
+            connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            connection.commit()
+        try:
+            context.configure(
+                connection=connection,
+                target_metadata=target_metadata,
+                render_as_batch=is_sqlite,
+            )
+            with context.begin_transaction():
+                if connection.dialect.name == "postgresql":
+                    # DDL on large tables may outlast the app's statement_timeout
+                    connection.exec_driver_sql("SET LOCAL statement_timeout = 0")
+                context.run_migrations()
+                if is_sqlite:
+                    # Enforcement was off; refuse to commit dangling references
+                    violations = connection.exec_driver_sql("PRAGMA foreign_key_check").all()
+                    if violations:
+                        raise RuntimeError(f"Foreign key violations after migration: {violations}")
+        finally:
+            if is_sqlite:
+                # The connection goes back to the app's pool; restore enforcement
+                connection.rollback()
+                connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+                connection.commit()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
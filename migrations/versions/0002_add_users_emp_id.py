@@ -0,0 +1,33 @@
+"""Add users.emp_id.
+
+Replaces the ad-hoc ALTER TABLE that used to run in the app lifespan.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("users", sa.Column("emp_id", sa.String(length=50), nullable=True))
+    op.create_index("ix_users_emp_id", "users", ["emp_id"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_emp_id", table_name="users")
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("emp_id")
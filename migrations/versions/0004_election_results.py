@@ -0,0 +1,39 @@
+"""Materialized per-candidate results for closed elections.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "election_results",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("election_id", sa.String(length=36), nullable=False),
+        sa.Column("candidate_id", sa.String(length=36), nullable=False),
+        sa.Column("vote_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["candidate_id"], ["candidates.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["election_id"], ["elections.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("election_id", "candidate_id", name="uq_result_election_candidate"),
+    )
+    op.create_index("ix_election_results_election_id", "election_results", ["election_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("election_results")
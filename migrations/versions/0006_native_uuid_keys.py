@@ -0,0 +1,78 @@
+"""Store UUID keys as native uuid on PostgreSQL.
+
+Other dialects keep VARCHAR(36), so this revision is a no-op there.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+UUID_COLUMNS = {
+    "users": ["id"],
+    "user_roles": ["id", "user_id"],
+    "organizations": ["id", "created_by"],
+    "elections": ["id", "organization_id", "created_by"],
+    "candidates": ["id", "election_id"],
+    "voters": ["id", "user_id", "election_id"],
+    "votes": ["id", "election_id", "candidate_id"],
+    "election_results": ["id", "election_id", "candidate_id"],
+}
+
+# (table, column, referred table, ondelete), named by PostgreSQL's default convention
+FOREIGN_KEYS = [
+    ("user_roles", "user_id", "users", "CASCADE"),
+    ("organizations", "created_by", "users", None),
+    ("elections", "organization_id", "organizations", "CASCADE"),
+    ("elections", "created_by", "users", None),
+    ("candidates", "election_id", "elections", "CASCADE"),
+    ("voters", "user_id", "users", "CASCADE"),
+    ("voters", "election_id", "elections", "CASCADE"),
+    ("votes", "election_id", "elections", "CASCADE"),
+    ("votes", "candidate_id", "candidates", "CASCADE"),
+    ("election_results", "election_id", "elections", "CASCADE"),
+    ("election_results", "candidate_id", "candidates", "CASCADE"),
+]
+
+
+def _convert(type_, using: str) -> None:
+    # Referencing and referenced columns must change type together, so drop the
+    # foreign keys around the ALTERs and recreate them afterwards.
+    for table, column, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(f"{table}_{column}_fkey", table, type_="foreignkey")
+    for table, columns in UUID_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table, column, type_=type_, postgresql_using=f"{column}::{using}"
+            )
+    for table, column, referred, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(
+            f"{table}_{column}_fkey", table, referred, [column], ["id"], ondelete=ondelete
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+    _convert(postgresql.UUID(as_uuid=False), "uuid")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+    _convert(sa.String(length=36), "varchar(36)")
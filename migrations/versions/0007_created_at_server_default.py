@@ -0,0 +1,47 @@
+"""Generate created_at timestamps in the database.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ["users", "organizations", "elections", "candidates", "votes"]
+
+
+def _utcnow() -> sa.TextClause:
+    if op.get_context().dialect.name == "postgresql":
+        return sa.text("(now() AT TIME ZONE 'utc')")
+    return sa.text("CURRENT_TIMESTAMP")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                "created_at", existing_type=sa.DateTime(), existing_nullable=False,
+                server_default=_utcnow(),
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                "created_at", existing_type=sa.DateTime(), existing_nullable=False,
+                server_default=None,
+            )
@@ -0,0 +1,27 @@
+"""Drop ix_user_roles_user_id, covered by uq_user_role.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, Sequence[str], None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index("ix_user_roles_user_id", table_name="user_roles")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_user_roles_user_id", "user_roles", ["user_id"])
@@ -0,0 +1,109 @@
+"""Upgrade a populated pre-Alembic SQLite database with ``python -m app.bootstrap``.
+
+Run with ``python -m unittest discover tests``. Each step runs in a subprocess
+so the app's settings and engine pick up the temporary DATABASE_URL.
+"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import unittest
+import uuid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TABLES = ["users", "user_roles", "organizations", "elections", "candidates", "voters", "votes"]
+
+
+class BaselineUpgradeTest(unittest.TestCase):
+    """A database created by create_all (no alembic_version) keeps its rows through head."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "baseline.db")
+        # The seeded super admin already exists, so bootstrap adds no user or grant
+        self.env = dict(
+            os.environ, DATABASE_URL=f"sqlite:///{self.db_path}", SUPER_ADMIN_EMAIL="admin@example.com"
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _run(self, *args):
+        result = subprocess.run(
+            [sys.executable, *args], cwd=ROOT, env=self.env, capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+
+    def _populate(self):
+        """Build the baseline schema (revision 0002, unversioned) and fill every table."""
+        self._run("-m", "alembic", "upgrade", "0002")
+        ids = {name: str(uuid.uuid4()) for name in ("user", "org", "election", "a", "b", "voter", "vote")}
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA foreign_keys=ON")
+        with conn:
+            conn.execute("DROP TABLE alembic_version")
+            conn.execute(
+                "INSERT INTO users (id, email, password_hash, full_name, is_active, created_at, emp_id) "
+                "VALUES (?, 'admin@example.com', 'x', 'Admin', 1, CURRENT_TIMESTAMP, 'E1')",
+                (ids["user"],),
+            )
+            conn.execute("INSERT INTO roles (name) VALUES ('SUPER_ADMIN')")
+            conn.execute(
+                "INSERT INTO user_roles (id, user_id, role_id) VALUES (?, ?, 1)",
+                (str(uuid.uuid4()), ids["user"]),
+            )
+            conn.execute(
+                "INSERT INTO organizations (id, name, created_by, created_at) "
+                "VALUES (?, 'Org', ?, CURRENT_TIMESTAMP)",
+                (ids["org"], ids["user"]),
+            )
+            conn.execute(
+                "INSERT INTO elections (id, organization_id, title, start_time, end_time, status, "
+                "created_by, created_at) VALUES (?, ?, 'E', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, "
+                "'active', ?, CURRENT_TIMESTAMP)",
+                (ids["election"], ids["org"], ids["user"]),
+            )
+            for key in ("a", "b"):
+                conn.execute(
+                    "INSERT INTO candidates (id, election_id, name, created_at) "
+                    "VALUES (?, ?, ?, CURRENT_TIMESTAMP)",
+                    (ids[key], ids["election"], key),
+                )
+            conn.execute(
+                "INSERT INTO voters (id, user_id, election_id, is_eligible) VALUES (?, ?, ?, 1)",
+                (ids["voter"], ids["user"], ids["election"]),
+            )
+            conn.execute(
+                "INSERT INTO votes (id, election_id, candidate_id, hashed_voter_token, created_at) "
+                "VALUES (?, ?, ?, 'token', CURRENT_TIMESTAMP)",
+                (ids["vote"], ids["election"], ids["a"]),
+            )
+        conn.close()
+
+    def _counts(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return {t: conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in TABLES}
+        finally:
+            conn.close()
+
+    def test_upgrade_keeps_rows(self):
+        self._populate()
+        before = self._counts()
+
+        self._run("-m", "app.bootstrap")
+
+        self.assertEqual(self._counts(), before)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertEqual(conn.execute("PRAGMA foreign_key_check").fetchall(), [])
+            self.assertEqual(conn.execute("SELECT version_num FROM alembic_version").fetchone()[0], "0008")
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
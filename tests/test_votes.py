@@ -0,0 +1,97 @@
+"""Vote casting and status against votes stored in the legacy token format.
+
+The app reads its settings at import time, so DATABASE_URL is pointed at a
+temporary SQLite file before anything from ``app`` is imported.
+"""
+
+import os
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta
+
+_tmpdir = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir.name}/votes.db"
+os.environ["RUN_MIGRATIONS_ON_STARTUP"] = "true"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app.core.config import get_settings  # noqa: E402
+from app.core.database import engine  # noqa: E402
+from app.core.security import generate_vote_token, legacy_vote_token  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+class LegacyVoteTokenTest(unittest.TestCase):
+    """A vote recorded as sha256(token) still blocks a second vote."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(app)
+        cls.client.__enter__()
+        settings = get_settings()
+        login = cls.client.post("/api/auth/login", json={
+            "email": settings.SUPER_ADMIN_EMAIL, "password": settings.SUPER_ADMIN_PASSWORD,
+        })
+        cls.auth = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        cls.user = cls.client.get("/api/auth/me", headers=cls.auth).json()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.__exit__(None, None, None)
+        engine.dispose()
+        _tmpdir.cleanup()
+
+    def _active_election(self):
+        org = self.client.post("/api/organizations/", headers=self.auth, json={"name": "Org"}).json()
+        now = datetime.utcnow()
+        election = self.client.post("/api/elections/", headers=self.auth, json={
+            "organization_id": org["id"],
+            "title": "Election",
+            "start_time": (now - timedelta(hours=1)).isoformat(),
+            "end_time": (now + timedelta(hours=1)).isoformat(),
+        }).json()
+        candidates = [
+            self.client.post(f"/api/elections/{election['id']}/candidates",
+                             headers=self.auth, json={"name": name}).json()
+            for name in ("a", "b")
+        ]
+        self.client.put(f"/api/elections/{election['id']}/activate", headers=self.auth)
+        return election["id"], [c["id"] for c in candidates]
+
+    def _store_legacy_vote(self, election_id, candidate_id):
+        identifier = self.user.get("emp_id") or self.user["id"]
+        token = legacy_vote_token(generate_vote_token(identifier, election_id))
+        with engine.begin() as conn:
+            conn.execute(
+                text("INSERT INTO votes (id, election_id, candidate_id, hashed_voter_token, created_at) "
+                     "VALUES (:id, :election_id, :candidate_id, :token, CURRENT_TIMESTAMP)"),
+                {"id": str(uuid.uuid4()), "election_id": election_id,
+                 "candidate_id": candidate_id, "token": token},
+            )
+
+    def test_legacy_vote_blocks_second_vote(self):
+        election_id, (first, second) = self._active_election()
+        self._store_legacy_vote(election_id, first)
+
+        status = self.client.get(f"/api/vote/status/{election_id}", headers=self.auth)
+        self.assertTrue(status.json()["has_voted"])
+
+        cast = self.client.post("/api/vote/", headers=self.auth,
+                                json={"election_id": election_id, "candidate_id": second})
+        self.assertEqual(cast.status_code, 409, cast.text)
+
+    def test_vote_without_legacy_token(self):
+        election_id, (first, _) = self._active_election()
+
+        cast = self.client.post("/api/vote/", headers=self.auth,
+                                json={"election_id": election_id, "candidate_id": first})
+        self.assertEqual(cast.status_code, 200, cast.text)
+        again = self.client.post("/api/vote/", headers=self.auth,
+                                 json={"election_id": election_id, "candidate_id": first})
+        self.assertEqual(again.status_code, 409, again.text)
+
+
+if __name__ == "__main__":
+    unittest.main()